@@ -1,47 +1,179 @@
 import argparse
+import hashlib
+import os
+import shutil
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import repeat
 from pathlib import Path
 import fitz  # pymupdf
 import re
 import unicodedata
 
+_fused_clean: Callable[[str], str] | None
+try:
+    # Optional Cython build of the filter/whitespace passes (pdf2text_clean.pyx)
+    from pdf2text_clean import fused_clean as _fused_clean
+except ImportError:
+    _fused_clean = None
 
-def extract_text_from_pdf(pdf_path: Path) -> str:
+# Characters kept by clean_text: alphanumerics, Japanese scripts and common punctuation
+_NON_ALLOWED_RE = re.compile(
+    r"[^a-zA-Z0-9\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FFF\u3000-\u303F\s\.\,\!\?\:\;\'\"\(\)\[\]\{\}]"
+)
+_WS_RE = re.compile(r"\s+")
+# Spaces to drop once whitespace has been collapsed: before punctuation and
+# between Japanese characters, which PDF extraction often splits with spaces.
+# Spaces between Latin words are word boundaries and are kept. Zero-width
+# lookarounds let both rules run in a single pass without backreference
+# substitution.
+_DROP_SPACE_RE = re.compile(
+    r" (?=[^\w\s])|(?<=[\u3040-\u30FF\u4E00-\u9FFF]) (?=[\u3040-\u30FF\u4E00-\u9FFF])"
+)
+
+# Text extraction flags: start from PyMuPDF's defaults for "text" output, let
+# MuPDF join words hyphenated across line breaks, and skip ligature
+# preservation since NFKC in clean_text expands ligatures anyway
+_TEXT_FLAGS = (
+    fitz.TEXTFLAGS_TEXT & ~fitz.TEXT_PRESERVE_LIGATURES
+) | fitz.TEXT_DEHYPHENATE
+
+# Documents with at least this many pages are extracted and cleaned in
+# parallel, in batches of _PAGE_BATCH_SIZE pages per task to keep worker
+# memory bounded
+_PARALLEL_PAGE_THRESHOLD = 50
+_PAGE_BATCH_SIZE = 10
+
+# Output is streamed page by page through a 1 MiB write buffer
+_WRITE_CHUNK_SIZE = 1 << 20
+
+# PDFs are hashed for the cache key in blocks of this size
+_HASH_BLOCK_SIZE = 1 << 20
+
+# Mixed into the cache key together with the PyMuPDF version, whose text
+# engine also affects the output; bump whenever extraction or cleaning changes
+CLEAN_VERSION = 2
+
+
+def iter_pdf_pages(
+    pdf_path: Path, page_numbers: Iterable[int] | None = None
+) -> Iterator[str]:
+    # Yield page texts one at a time so each page can be cleaned and released
+    # before the next one is extracted
     with fitz.open(pdf_path) as doc:
-        text = ""
-        for page in doc:
-            text += page.get_text()  # type:ignore
-        return text
+        for i in range(len(doc)) if page_numbers is None else page_numbers:
+            yield doc[i].get_text("text", flags=_TEXT_FLAGS)  # type:ignore
+
+
+def extract_text_from_pdf(pdf_path: Path) -> str:
+    # Kept as public API for callers that want the raw, uncleaned text;
+    # process_file streams pages through iter_clean_pdf_text instead
+    return "".join(iter_pdf_pages(pdf_path))
 
 
 def clean_text(text: str) -> str:
+    # Normalize unicode characters first so that full-width letters, digits and
+    # punctuation are folded to ASCII instead of being dropped by the filter below
+    cleaned_text = unicodedata.normalize("NFKC", text)
+    if _fused_clean is not None:
+        return _fused_clean(cleaned_text)
     # Remove non-alphanumeric characters except for Japanese characters and common punctuation
-    cleaned_text = re.sub(
-        r"[^a-zA-Z0-9\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FFF\u3000-\u303F\s\.\,\!\?\:\;\'\"\(\)\[\]\{\}]",
-        "",
-        text,
-    )
+    cleaned_text = _NON_ALLOWED_RE.sub("", cleaned_text)
     # Remove extra whitespace
-    cleaned_text = re.sub(r"\s+", " ", cleaned_text).strip()
-    # Remove spaces before punctuations
-    cleaned_text = re.sub(r"\s+([^\w\s])", r"\1", cleaned_text)
-    # Remove spaces between alphanumeric characters
-    cleaned_text = re.sub(r"(\w)\s+(\w)", r"\1\2", cleaned_text)
-    # Normalize unicode characters
-    cleaned_text = unicodedata.normalize("NFKC", cleaned_text)
+    cleaned_text = _WS_RE.sub(" ", cleaned_text).strip()
+    # Remove spaces before punctuations and between Japanese characters
+    cleaned_text = _DROP_SPACE_RE.sub("", cleaned_text)
     return cleaned_text
 
 
-def process_file(input_path: Path, output_path: Path, overwrite: bool) -> bool:
+def _clean_page_batch(pdf_path: Path, page_numbers: range) -> list[str]:
+    # Documents cannot be pickled, so each worker re-opens the file
+    return [clean_text(text) for text in iter_pdf_pages(pdf_path, page_numbers)]
+
+
+def _join_clean_pages(pages: Iterable[str]) -> Iterator[str]:
+    # Page breaks become the single space the whitespace collapse would leave.
+    # The space-removal rules only look one character to each side, so every
+    # seam can be checked on its own instead of re-scanning the joined text.
+    last_char = ""
+    for page in pages:
+        if not page:
+            continue
+        if last_char and not _DROP_SPACE_RE.search(f"{last_char} {page[0]}"):
+            yield " "
+        yield page
+        last_char = page[-1]
+
+
+def iter_clean_pdf_text(pdf_path: Path, workers: int = 1) -> Iterator[str]:
+    if workers > 1:
+        with fitz.open(pdf_path) as doc:
+            page_count = len(doc)
+    else:
+        page_count = 0
+
+    if page_count < _PARALLEL_PAGE_THRESHOLD:
+        yield from _join_clean_pages(map(clean_text, iter_pdf_pages(pdf_path)))
+        return
+
+    batches = [
+        range(start, min(start + _PAGE_BATCH_SIZE, page_count))
+        for start in range(0, page_count, _PAGE_BATCH_SIZE)
+    ]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # map() yields results in submission order, so pages stay in order
+        results = executor.map(_clean_page_batch, repeat(pdf_path), batches)
+        yield from _join_clean_pages(page for batch in results for page in batch)
+
+
+def _cache_key(pdf_path: Path) -> str:
+    seed = f"{CLEAN_VERSION}:{fitz.VersionBind}".encode()
+    digest = hashlib.blake2b(seed, digest_size=16)
+    with pdf_path.open("rb") as pdf_file:
+        while chunk := pdf_file.read(_HASH_BLOCK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def process_file(
+    input_path: Path,
+    output_path: Path,
+    overwrite: bool,
+    workers: int = 1,
+    cache_dir: Path | None = None,
+) -> bool:
     if output_path.exists() and not overwrite:
         print(f"Skipping '{input_path}' as output file '{output_path}' already exists.")
         return False
 
     try:
-        text = extract_text_from_pdf(input_path)
-        cleaned_text = clean_text(text)
+        cache_path = None
+        if cache_dir is not None:
+            cache_path = cache_dir / f"{_cache_key(input_path)}.txt"
+            if cache_path.exists():
+                shutil.copyfile(cache_path, output_path)
+                print(
+                    f"Text for '{input_path}' restored from cache to '{output_path}'."
+                )
+                return True
+
+        with output_path.open(
+            "w", encoding="utf-8", buffering=_WRITE_CHUNK_SIZE
+        ) as output_file:
+            for piece in iter_clean_pdf_text(input_path, workers):
+                output_file.write(piece)
 
-        with output_path.open("w", encoding="utf-8") as output_file:
-            output_file.write(cleaned_text)
+        if cache_path is not None:
+            # Copy under a per-process name first so parallel workers never
+            # expose a partially written cache entry
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            try:
+                shutil.copyfile(output_path, tmp_path)
+                tmp_path.replace(cache_path)
+            except OSError as e:
+                # The output itself is complete; only the cache entry is lost
+                tmp_path.unlink(missing_ok=True)
+                print(f"Warning: could not cache text for '{input_path}': {e}")
 
         if overwrite:
             print(
@@ -57,6 +189,16 @@ def process_file(input_path: Path, output_path: Path, overwrite: bool) -> bool:
         return False
 
 
+def _positive_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Extract text from PDF files.")
     parser.add_argument(
@@ -75,17 +217,37 @@ def main() -> None:
         action="store_true",
         help="Overwrite existing output files.",
     )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=_positive_int,
+        default=min(os.cpu_count() or 1, 6),
+        help="Number of worker processes (default: CPU count, at most 6).",
+    )
+    parser.add_argument(
+        "-c",
+        "--cache-dir",
+        type=Path,
+        help="Directory for caching cleaned text by PDF content hash.",
+    )
     args = parser.parse_args()
 
     input_path: Path = args.input
     overwrite: bool = args.overwrite
+    workers: int = args.workers
+    cache_dir: Path | None = args.cache_dir
+    if cache_dir is not None:
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            parser.error(f"cannot use cache directory '{cache_dir}': {e}")
 
     if input_path.is_file():
         if args.output:
             output_path: Path = args.output
         else:
             output_path = input_path.with_suffix(".txt")
-        process_file(input_path, output_path, overwrite)
+        process_file(input_path, output_path, overwrite, workers, cache_dir)
     elif input_path.is_dir():
         if args.output:
             output_dir: Path = args.output
@@ -95,17 +257,34 @@ def main() -> None:
         else:
             output_dir = input_path
 
-        total_files = 0
+        pdf_files = list(input_path.glob("*.pdf"))
+        total_files = len(pdf_files)
         success_files = 0
         error_files = 0
 
-        for pdf_file in input_path.glob("*.pdf"):
-            output_path = output_dir / pdf_file.with_suffix(".txt").name
-            total_files += 1
-            if process_file(pdf_file, output_path, overwrite):
-                success_files += 1
-            else:
-                error_files += 1
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(
+                    process_file,
+                    pdf_file,
+                    output_dir / pdf_file.with_suffix(".txt").name,
+                    overwrite,
+                    cache_dir=cache_dir,
+                ): pdf_file
+                for pdf_file in pdf_files
+            }
+            for future in as_completed(futures):
+                try:
+                    succeeded = future.result()
+                except Exception as e:
+                    # A worker that dies (e.g. a MuPDF crash) breaks the pool
+                    # instead of returning, so count it like any other failure
+                    print(f"Error processing '{futures[future]}': {e}")
+                    succeeded = False
+                if succeeded:
+                    success_files += 1
+                else:
+                    error_files += 1
 
         print(
             f"Processed {total_files} files: {success_files} success, {error_files} errors."
@@ -0,0 +1 @@
+def fused_clean(text: str) -> str: ...
@@ -0,0 +1,62 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Native single-pass version of the character filtering in pdf2text.clean_text.
+
+Build in place with ``cythonize -i pdf2text_clean.pyx``. pdf2text falls back to
+its regex pipeline when this extension is not built, so the rules below must
+stay in sync with _NON_ALLOWED_RE, _WS_RE and _DROP_SPACE_RE there;
+tests/test_pdf2text_clean.py compares the two.
+"""
+
+from cpython.mem cimport PyMem_Free, PyMem_Malloc
+from cpython.unicode cimport Py_UNICODE_ISALNUM, Py_UNICODE_ISSPACE
+
+
+cdef extern from "Python.h":
+    int PyUnicode_4BYTE_KIND
+    object PyUnicode_FromKindAndData(int kind, const void *buffer, Py_ssize_t size)
+
+
+cdef inline bint _is_japanese(Py_UCS4 c):
+    return 0x3040 <= c <= 0x30FF or 0x4E00 <= c <= 0x9FFF
+
+
+cdef inline bint _is_allowed(Py_UCS4 c):
+    return (
+        (0x61 <= c <= 0x7A)  # a-z
+        or (0x41 <= c <= 0x5A)  # A-Z
+        or (0x30 <= c <= 0x39)  # 0-9
+        or (0x3000 <= c <= 0x30FF)  # CJK punctuation, hiragana, katakana
+        or (0x4E00 <= c <= 0x9FFF)  # CJK unified ideographs
+        or c in u".,!?:;'\"()[]{}"
+    )
+
+
+cpdef str fused_clean(str text):
+    """Drop disallowed characters, collapse and strip whitespace, and remove
+    spaces before punctuation and between Japanese characters, in one pass."""
+    cdef Py_ssize_t n = 0
+    cdef Py_UCS4 c
+    cdef Py_UCS4 prev = 0
+    cdef bint pending_space = False
+    cdef Py_UCS4 *buf = <Py_UCS4 *>PyMem_Malloc(len(text) * sizeof(Py_UCS4) + 1)
+    if buf == NULL:
+        raise MemoryError()
+    try:
+        for c in text:
+            if Py_UNICODE_ISSPACE(c):
+                # Leading whitespace is stripped; runs collapse to one space
+                pending_space = n > 0
+            elif _is_allowed(c):
+                if pending_space:
+                    if Py_UNICODE_ISALNUM(c) and not (
+                        _is_japanese(prev) and _is_japanese(c)
+                    ):
+                        buf[n] = u" "
+                        n += 1
+                    pending_space = False
+                buf[n] = c
+                n += 1
+                prev = c
+        return PyUnicode_FromKindAndData(PyUnicode_4BYTE_KIND, buf, n)
+    finally:
+        PyMem_Free(buf)
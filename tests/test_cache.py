@@ -0,0 +1,80 @@
+import shutil
+from pathlib import Path
+
+import fitz  # pymupdf
+import pytest
+
+import pdf2text
+
+
+@pytest.fixture
+def pdf_path(tmp_path: Path) -> Path:
+    path = tmp_path / "input.pdf"
+    with fitz.open() as doc:
+        doc.new_page().insert_text((72, 72), "cached text")
+        doc.save(path)
+    return path
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path) -> Path:
+    path = tmp_path / "cache"
+    path.mkdir()
+    return path
+
+
+def test_cache_miss_writes_entry(pdf_path: Path, cache_dir: Path) -> None:
+    output_path = pdf_path.with_suffix(".txt")
+
+    assert pdf2text.process_file(pdf_path, output_path, False, cache_dir=cache_dir)
+
+    cache_path = cache_dir / f"{pdf2text._cache_key(pdf_path)}.txt"
+    assert output_path.read_text(encoding="utf-8") == "cached text"
+    assert cache_path.read_text(encoding="utf-8") == "cached text"
+    assert list(cache_dir.iterdir()) == [cache_path]
+
+
+def test_cache_hit_skips_extraction(
+    pdf_path: Path, cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    output_path = pdf_path.with_suffix(".txt")
+    cache_path = cache_dir / f"{pdf2text._cache_key(pdf_path)}.txt"
+    cache_path.write_text("from cache", encoding="utf-8")
+
+    def fail(*args: object, **kwargs: object) -> None:
+        raise AssertionError("extraction should be skipped on a cache hit")
+
+    monkeypatch.setattr(pdf2text, "iter_clean_pdf_text", fail)
+
+    assert pdf2text.process_file(pdf_path, output_path, False, cache_dir=cache_dir)
+    assert output_path.read_text(encoding="utf-8") == "from cache"
+
+
+def test_clean_version_changes_cache_key(
+    pdf_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    key = pdf2text._cache_key(pdf_path)
+    monkeypatch.setattr(pdf2text, "CLEAN_VERSION", pdf2text.CLEAN_VERSION + 1)
+    assert pdf2text._cache_key(pdf_path) != key
+
+
+def test_cache_write_failure_is_a_warning(
+    pdf_path: Path,
+    cache_dir: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    output_path = pdf_path.with_suffix(".txt")
+    copyfile = shutil.copyfile
+
+    def copy_to_full_disk(src: Path, dst: Path) -> Path:
+        if dst.parent == cache_dir:
+            raise OSError(28, "No space left on device")
+        return copyfile(src, dst)
+
+    monkeypatch.setattr(shutil, "copyfile", copy_to_full_disk)
+
+    assert pdf2text.process_file(pdf_path, output_path, False, cache_dir=cache_dir)
+    assert output_path.read_text(encoding="utf-8") == "cached text"
+    assert list(cache_dir.iterdir()) == []
+    assert "Warning: could not cache text" in capsys.readouterr().out
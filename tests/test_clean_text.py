@@ -0,0 +1,17 @@
+from pdf2text import clean_text
+
+
+def test_keeps_spaces_between_latin_words() -> None:
+    assert clean_text("hello   world\nagain") == "hello world again"
+
+
+def test_drops_spaces_between_japanese_characters() -> None:
+    assert clean_text("日本 語 の テキスト") == "日本語のテキスト"
+
+
+def test_drops_space_before_punctuation() -> None:
+    assert clean_text("hello , world .") == "hello, world."
+
+
+def test_folds_full_width_characters() -> None:
+    assert clean_text("Ｆｕｌｌ ｗｉｄｔｈ １２３！") == "Full width 123!"
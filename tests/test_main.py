@@ -0,0 +1,41 @@
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+import pytest
+
+import pdf2text
+
+
+@pytest.mark.parametrize("value, expected", [("1", 1), ("6", 6)])
+def test_positive_int_accepts_counts(value: str, expected: int) -> None:
+    assert pdf2text._positive_int(value) == expected
+
+
+@pytest.mark.parametrize("value", ["0", "-2", "two"])
+def test_positive_int_rejects_invalid_counts(value: str) -> None:
+    with pytest.raises(argparse.ArgumentTypeError):
+        pdf2text._positive_int(value)
+
+
+def test_directory_tally_counts_crashed_workers(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    for name in ("ok", "failed", "crashed"):
+        (tmp_path / f"{name}.pdf").touch()
+
+    def fake_process_file(input_path: Path, *args: object, **kwargs: object) -> bool:
+        if input_path.stem == "crashed":
+            raise BrokenProcessPool("worker died")
+        return input_path.stem == "ok"
+
+    monkeypatch.setattr(pdf2text, "process_file", fake_process_file)
+    monkeypatch.setattr(pdf2text, "ProcessPoolExecutor", ThreadPoolExecutor)
+    monkeypatch.setattr("sys.argv", ["pdf2text.py", "-i", str(tmp_path), "-j", "2"])
+
+    pdf2text.main()
+
+    out = capsys.readouterr().out
+    assert f"Error processing '{tmp_path / 'crashed.pdf'}': worker died" in out
+    assert "Processed 3 files: 1 success, 2 errors." in out
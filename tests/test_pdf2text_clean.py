@@ -0,0 +1,25 @@
+import random
+import unicodedata
+
+import pytest
+
+import pdf2text
+
+pdf2text_clean = pytest.importorskip("pdf2text_clean")
+
+# Latin, digits, kana/kanji, CJK punctuation, allowed and disallowed ASCII
+# punctuation, assorted Unicode whitespace, full-width and astral characters
+ALPHABET = (
+    "abZ9_ 。、〆〇々日本語かなカナ\n\t\x0b\x1c\x85\xa0　"
+    ",.!?:;'\"()[]{}#$-ＡＢ１😀ﬁé"
+)
+
+
+def test_fused_clean_matches_regex_pipeline(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(pdf2text, "_fused_clean", None)
+    rng = random.Random(0)
+    for _ in range(20000):
+        text = "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 25)))
+        normalized = unicodedata.normalize("NFKC", text)
+        expected = pdf2text.clean_text(text)
+        assert pdf2text_clean.fused_clean(normalized) == expected, repr(text)
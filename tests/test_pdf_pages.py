@@ -0,0 +1,57 @@
+from pathlib import Path
+
+import fitz  # pymupdf
+import pytest
+
+import pdf2text
+from pdf2text import (
+    _join_clean_pages,
+    clean_text,
+    extract_text_from_pdf,
+    iter_clean_pdf_text,
+)
+
+
+@pytest.mark.parametrize(
+    "pages",
+    [
+        ["hello\n", "world\n"],
+        ["hello\n", ", world\n"],
+        ["end of page.\n", "(next)\n"],
+        ["日本\n", "語のテキスト\n"],
+        ["日本\n", "Latin\n"],
+        ["first\n", "\n", " \n", "second\n"],
+        ["\n", "only page\n", "\n"],
+    ],
+)
+def test_joined_pages_match_whole_document_cleaning(pages: list[str]) -> None:
+    joined = "".join(_join_clean_pages(map(clean_text, pages)))
+    assert joined == clean_text("".join(pages))
+
+
+@pytest.fixture
+def large_pdf(tmp_path: Path) -> Path:
+    pdf_path = tmp_path / "large.pdf"
+    with fitz.open() as doc:
+        for i in range(pdf2text._PARALLEL_PAGE_THRESHOLD + 5):
+            page = doc.new_page()
+            page.insert_text((72, 72), f"Page {i} starts here,\nand ends here.")
+        doc.save(pdf_path)
+    return pdf_path
+
+
+def test_parallel_cleaning_matches_serial(large_pdf: Path) -> None:
+    serial = "".join(iter_clean_pdf_text(large_pdf, workers=1))
+    parallel = "".join(iter_clean_pdf_text(large_pdf, workers=2))
+    assert serial.startswith("Page 0 starts here, and ends here. Page 1")
+    assert parallel == serial
+
+
+def test_extract_text_from_pdf_returns_raw_pages_in_order(tmp_path: Path) -> None:
+    pdf_path = tmp_path / "two_pages.pdf"
+    with fitz.open() as doc:
+        for text in ("first  page", "second page"):
+            doc.new_page().insert_text((72, 72), text)
+        doc.save(pdf_path)
+
+    assert extract_text_from_pdf(pdf_path) == "first  page\nsecond page\n"